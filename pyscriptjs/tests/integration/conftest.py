@@ -1,6 +1,7 @@
+import os
 import threading
-from http.server import HTTPServer as SuperHTTPServer
 from http.server import SimpleHTTPRequestHandler
+from http.server import ThreadingHTTPServer as SuperHTTPServer
 
 import pytest
 
@@ -84,6 +85,10 @@ class HTTPServer(SuperHTTPServer):
     Class for wrapper to run SimpleHTTPServer on Thread.
     Ctrl +Only Thread remains dead when terminated with C.
     Keyboard Interrupt passes.
+
+    It handles each request in its own thread, so that the resources which
+    the browser fetches in parallel (pyscript.js, pyscript.css, pyodide,
+    packages, ...) are not served one at a time.
     """
 
     def run(self):
@@ -101,7 +106,12 @@ def http_server(logger):
         def log_message(self, fmt, *args):
             logger.log("http_server", fmt % args, color="blue")
 
-    host, port = "127.0.0.1", 8080
+    # when running in parallel with pytest-xdist (e.g. pytest -n auto), each
+    # worker has its own session and thus its own server: give each of them a
+    # different port, to avoid clashes. PYTEST_XDIST_WORKER is "gw0", "gw1",
+    # etc.
+    worker_id = os.environ.get("PYTEST_XDIST_WORKER", "gw0")
+    host, port = "127.0.0.1", 8080 + int(worker_id[2:])
     base_url = f"http://{host}:{port}"
 
     # serve_Run forever under thread
@@ -1,3 +1,6 @@
+import hashlib
+import json
+import os
 import pdb
 import re
 import sys
@@ -60,6 +63,12 @@ class PyScriptTest:
         Using the standard pytest behavior, we can request more fixtures:
         tmpdir, and page; 'page' is a fixture provided by pytest-playwright.
 
+        Note that the expensive fixtures are shared by the whole session:
+        pytest-playwright's 'browser' is session-scoped and so is our
+        'http_server' (see conftest.py). Only 'context' and 'page' are
+        created anew for each test, so that tests are isolated from each
+        other without paying for a browser launch every time.
+
         Then, we save these fixtures on the self and proceed with more
         initialization. The end result is that the requested fixtures are
         automatically made available as self.xxx in all methods.
@@ -79,7 +88,10 @@ class PyScriptTest:
             # use the internal playwright routing
             self.http_server = "http://fake_server"
             self.router = SmartRouter(
-                "fake_server", logger=logger, usepdb=request.config.option.usepdb
+                "fake_server",
+                logger=logger,
+                usepdb=request.config.option.usepdb,
+                cache_dir=request.config.cache.mkdir("network_cache"),
             )
             self.router.install(page)
         #
@@ -506,6 +518,13 @@ class SmartRouter:
 
       - it intercepts the requests to the network and cache the results
         locally
+
+      - successful network responses for versioned URLs (e.g.
+        .../pyodide/v0.21.3/full/...) are also saved on disk (inside
+        .pytest_cache), so that big downloads such as Pyodide packages are
+        fetched only once, and not once per session or per xdist worker. URLs
+        which can change over time, like https://pyscript.net/latest/, are
+        never saved on disk. Use pytest --cache-clear to empty it.
     """
 
     @dataclass
@@ -520,18 +539,26 @@ class SmartRouter:
         headers: dict
         body: str
 
+    # a path segment which looks like a version number, e.g. "v0.21.3",
+    # "2022.09.1" or "d3@7.6.1"
+    _version_regexp = re.compile(r"(^v?|@)\d+(\.\d+)+$")
+
     # NOTE: this is a class attribute, which means that the cache is
     # automatically shared between all instances of Fake_Server (and thus all
     # tests of the pytest session)
     _cache = {}
 
-    def __init__(self, fake_server, *, logger, usepdb=False):
+    def __init__(self, fake_server, *, logger, usepdb=False, cache_dir=None):
         """
         fake_server: the domain name of the fake server
+
+        cache_dir: a pathlib.Path where to persist the network cache. If it's
+        None, the cache is kept only in memory.
         """
         self.fake_server = fake_server
         self.logger = logger
         self.usepdb = usepdb
+        self.cache_dir = cache_dir
         self.page = None
 
     def install(self, page):
@@ -590,10 +617,15 @@ class SmartRouter:
         if full_url in self._cache:
             kind = "CACHED"
             resp = self._cache[full_url]
+        elif (resp := self.load_from_disk(full_url)) is not None:
+            kind = "DISK CACHED"
+            self._cache[full_url] = resp
         else:
             kind = "NETWORK"
             resp = self.fetch_from_network(route.request)
             self._cache[full_url] = resp
+            if resp.status == 200:
+                self.save_to_disk(full_url, resp)
 
         self.log_request(resp.status, kind, full_url)
         route.fulfill(status=resp.status, headers=resp.headers, body=resp.body)
@@ -615,3 +647,50 @@ class SmartRouter:
             body=api_response.body(),
         )
         return cached_response
+
+    @classmethod
+    def is_versioned_url(cls, url):
+        """
+        Return True if the URL contains a version number, i.e. if its content
+        is not supposed to change over time and it's safe to keep it on disk
+        across sessions.
+        """
+        path = urllib.parse.urlparse(url).path
+        return any(cls._version_regexp.search(part) for part in path.split("/"))
+
+    def _disk_cache_paths(self, url):
+        key = hashlib.sha256(url.encode("utf-8")).hexdigest()
+        return (
+            self.cache_dir.joinpath(f"{key}.json"),
+            self.cache_dir.joinpath(f"{key}.body"),
+        )
+
+    def load_from_disk(self, url):
+        if self.cache_dir is None or not self.is_versioned_url(url):
+            return None
+        meta_path, body_path = self._disk_cache_paths(url)
+        try:
+            meta = json.loads(meta_path.read_text())
+            body = body_path.read_bytes()
+        except (OSError, ValueError):
+            return None
+        return self.CachedResponse(
+            status=meta["status"], headers=meta["headers"], body=body
+        )
+
+    def save_to_disk(self, url, resp):
+        if self.cache_dir is None or not self.is_versioned_url(url):
+            return
+        meta_path, body_path = self._disk_cache_paths(url)
+        meta = {"url": url, "status": resp.status, "headers": resp.headers}
+        # write to a temporary file and rename it, so that concurrent xdist
+        # workers never see a half-written entry. The body is written first,
+        # because load_from_disk considers an entry valid only if the
+        # metadata file exists.
+        for path, data in [(body_path, resp.body), (meta_path, json.dumps(meta))]:
+            tmp_path = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+            if isinstance(data, bytes):
+                tmp_path.write_bytes(data)
+            else:
+                tmp_path.write_text(data)
+            os.replace(tmp_path, path)
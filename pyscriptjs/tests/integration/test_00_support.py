@@ -1,10 +1,11 @@
+import pathlib
 import re
 import textwrap
 
 import pytest
 from playwright import sync_api
 
-from .support import JsErrors, JsErrorsDidNotRaise, PyScriptTest
+from .support import JsErrors, JsErrorsDidNotRaise, PyScriptTest, SmartRouter
 
 
 class TestSupport(PyScriptTest):
@@ -32,6 +33,27 @@ class TestSupport(PyScriptTest):
         content = self.page.content()
         assert "<h1>Hello world</h1>" in content
 
+    def test_smart_router_disk_cache(self):
+        cache_dir = pathlib.Path(self.tmpdir.join("network_cache").ensure(dir=True))
+        router = SmartRouter("fake_server", logger=self.logger, cache_dir=cache_dir)
+        resp = SmartRouter.CachedResponse(
+            status=200, headers={"content-type": "text/plain"}, body=b"hello"
+        )
+        #
+        # versioned URLs survive a round trip to disk, also when read by
+        # another router, e.g. in the next session
+        url = "https://cdn.jsdelivr.net/pyodide/v0.21.3/full/hello.txt"
+        assert router.load_from_disk(url) is None
+        router.save_to_disk(url, resp)
+        router2 = SmartRouter("fake_server", logger=self.logger, cache_dir=cache_dir)
+        assert router2.load_from_disk(url) == resp
+        #
+        # URLs which might change over time are never saved on disk
+        url = "https://pyscript.net/latest/pyscript.js"
+        router.save_to_disk(url, resp)
+        assert router.load_from_disk(url) is None
+        assert sorted(p.suffix for p in cache_dir.iterdir()) == [".body", ".json"]
+
     def test_console(self):
         """
         Test that we capture console.log messages correctly.